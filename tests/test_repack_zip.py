@@ -0,0 +1,91 @@
+"""Regression tests for `repack_zip`'s raw member copy (zipfile private API)."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "vsix-downloader.py"
+_spec = importlib.util.spec_from_file_location("vsix_downloader", _SRC)
+vd = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = vd
+_spec.loader.exec_module(vd)
+
+LOG = logging.getLogger("test_repack_zip")
+PAYLOAD = b"extension payload " * 64
+
+
+class RepackZipTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.src = self.dir / "src.zip"
+        self.dest = self.dir / "out.vsix"
+
+    def _write_src(self, compression: int = zipfile.ZIP_STORED) -> None:
+        with zipfile.ZipFile(self.src, "w", compression=compression) as z:
+            z.writestr("extension/", b"")
+            z.writestr("extension/package.json", b'{"name": "x"}')
+            z.writestr("extension/data.bin", PAYLOAD)
+
+    def _patch_src(self, needle: bytes, replacement: bytes) -> None:
+        data = self.src.read_bytes()
+        self.assertEqual(data.count(needle), 1)
+        self.src.write_bytes(data.replace(needle, replacement))
+
+    def test_round_trip_preserves_members(self) -> None:
+        for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            with self.subTest(compression=compression):
+                self._write_src(compression)
+                vd.repack_zip(self.src, self.dest, log=LOG)
+                with zipfile.ZipFile(self.dest) as z:
+                    self.assertIsNone(z.testzip())
+                    self.assertEqual(z.read("extension/data.bin"), PAYLOAD)
+                    self.assertEqual(
+                        [i.filename for i in z.infolist()],
+                        ["extension/", "extension/package.json", "extension/data.bin"],
+                    )
+
+    def test_bad_crc_is_rejected(self) -> None:
+        self._write_src()
+        self._patch_src(PAYLOAD, PAYLOAD[:-1] + b"!")
+        with self.assertRaises(zipfile.BadZipFile):
+            vd.repack_zip(self.src, self.dest, log=LOG)
+        self.assertFalse(self.dest.exists())
+
+    def test_bad_local_header_signature_is_rejected(self) -> None:
+        self._write_src()
+        with zipfile.ZipFile(self.src) as z:
+            offset = z.getinfo("extension/data.bin").header_offset
+        data = bytearray(self.src.read_bytes())
+        data[offset : offset + 4] = b"XXXX"
+        self.src.write_bytes(bytes(data))
+        with self.assertRaises(zipfile.BadZipFile):
+            vd.repack_zip(self.src, self.dest, log=LOG)
+
+    def test_local_header_name_mismatch_is_rejected(self) -> None:
+        self._write_src()
+        # Only the local header copy of the name is changed (same length).
+        data = self.src.read_bytes()
+        first = data.index(b"extension/data.bin")
+        self.src.write_bytes(data[:first] + b"extension/DATA.bin" + data[first + 18 :])
+        with self.assertRaises(zipfile.BadZipFile):
+            vd.repack_zip(self.src, self.dest, log=LOG)
+
+    def test_truncated_local_header_raises_bad_zip(self) -> None:
+        self._write_src()
+        with zipfile.ZipFile(self.src) as zin, zipfile.ZipFile(self.dest, "w") as zout:
+            info = zin.getinfo("extension/data.bin")
+            info.header_offset = self.src.stat().st_size - 4
+            with self.assertRaises(zipfile.BadZipFile):
+                vd._skip_local_header(zin, info)
+
+
+if __name__ == "__main__":
+    unittest.main()
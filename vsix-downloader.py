@@ -1,14 +1,34 @@
 from __future__ import annotations
 
 import gzip
+import http.client
+import io
+import json
 import logging
-import re
+import mmap
+import os
+import queue
+import shutil
+import struct
+import threading
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from email.message import Message
+from email.utils import collapse_rfc2231_value
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Callable, Iterable, Iterator, Mapping, Optional, Tuple
-from urllib.parse import unquote
-from urllib.request import Request, urlopen
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, urlopen
+
+try:  # optional: HTTP/2 multiplexing for batch downloads
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
 
 
 # =============================================================================
@@ -53,11 +73,38 @@ class VsixSpec:
         target_platform:
             Optional marketplace target platform (e.g. "linux-x64").
             Use None to omit the query parameter (commonly for "Universal" extensions).
+        publisher / extension_name:
+            The two halves of `unique_identifier` (read-only, derived).
+
+    Raises:
+        ValueError: If unique_identifier is not "publisher.extensionName".
     """
     unique_identifier: str
     version: str
     target_platform: str | None = "linux-x64"
 
+    def __post_init__(self) -> None:
+        self._split_identifier()  # reject malformed identifiers up front
+
+    @cached_property
+    def publisher(self) -> str:
+        """Publisher part of `unique_identifier` (before the first dot)."""
+        return self._split_identifier()[0]
+
+    @cached_property
+    def extension_name(self) -> str:
+        """Extension part of `unique_identifier` (after the first dot)."""
+        return self._split_identifier()[1]
+
+    def _split_identifier(self) -> Tuple[str, str]:
+        publisher, sep, package = self.unique_identifier.partition(".")
+        if not (publisher and sep and package):
+            raise ValueError(
+                f"Invalid extension identifier {self.unique_identifier!r}; "
+                'expected "publisher.extensionName"'
+            )
+        return publisher, package
+
 
 # =============================================================================
 # URL construction
@@ -75,10 +122,13 @@ def build_vspackage_url(spec: VsixSpec, base: str = MARKETPLACE_VSPACKAGE_BASE)
         A fully qualified URL to the extension 'vspackage' endpoint.
 
     Raises:
-        ValueError: If spec.unique_identifier is not "publisher.extensionName".
+        ValueError: If spec.unique_identifier is not "publisher.extensionName"
+            (raised when the VsixSpec is constructed).
     """
-    publisher, package = spec.unique_identifier.split(".", 1)
-    url = f"{base}/publishers/{publisher}/vsextensions/{package}/{spec.version}/vspackage"
+    url = (
+        f"{base}/publishers/{spec.publisher}/vsextensions/"
+        f"{spec.extension_name}/{spec.version}/vspackage"
+    )
     if spec.target_platform:
         url += f"?targetPlatform={spec.target_platform}"
     return url
@@ -88,26 +138,39 @@ def build_vspackage_url(spec: VsixSpec, base: str = MARKETPLACE_VSPACKAGE_BASE)
 # Header + filename handling
 # =============================================================================
 
-_CD_FILENAME_RE = re.compile(r'filename="?(?P<name>[^";]+)"?', re.IGNORECASE)
+# Header containers accepted throughout: the response's own (case-insensitive)
+# `http.client.HTTPMessage` / `email.message.Message`, or any plain mapping.
+HeaderMap = Union[http.client.HTTPMessage, Mapping[str, str]]
 
 
-def _header_get(headers: Mapping[str, str], name: str) -> str | None:
-    """Case-insensitive mapping access for HTTP headers."""
-    needle = name.lower()
-    for k, v in headers.items():
-        if k.lower() == needle:
-            return v
-    return None
+def _header_get(headers: HeaderMap, name: str) -> str | None:
+    """
+    Case-insensitive header lookup.
+
+    Response header objects (`HTTPMessage`, `httpx.Headers`) are already
+    case-insensitive, so this is a plain `.get()`. Any other mapping gets an
+    exact/lower-case lookup and then a scan.
+    """
+    if isinstance(headers, Message) or (httpx is not None and isinstance(headers, httpx.Headers)):
+        return headers.get(name)
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    if value is None:
+        needle = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == needle), None)
+    return value
 
 
 def filename_from_content_disposition(header: str | None) -> str | None:
     """
     Extract a filename from a Content-Disposition header.
 
-    Supports common forms:
+    Parsing is delegated to the stdlib `email` package, which handles quoting
+    and RFC 2231 / 5987 encoded values. Supports common forms:
         - filename="x"
         - filename=x
-        - filename*=UTF-8''<urlencoded>
+        - filename*=UTF-8''<urlencoded>   (preferred when both are present)
 
     Args:
         header: The Content-Disposition header value.
@@ -118,26 +181,20 @@ def filename_from_content_disposition(header: str | None) -> str | None:
     if not header:
         return None
 
-    # Prefer RFC 5987 / 6266 form: filename*=UTF-8''...
-    parts = [p.strip() for p in header.split(";")]
-    params: dict[str, str] = {}
-    for p in parts[1:]:
-        if "=" in p:
-            k, v = p.split("=", 1)
-            params[k.strip().lower()] = v.strip().strip('"')
-
-    if "filename*" in params:
-        v = params["filename*"]
-        if "''" in v:
-            _, enc = v.split("''", 1)
-            return unquote(enc)
-        return unquote(v)
+    try:
+        msg = Message()
+        msg["Content-Disposition"] = header
+        params = msg.get_params([], header="Content-Disposition")[1:]
+    except (ValueError, TypeError):
+        return None
 
-    m = _CD_FILENAME_RE.search(header)
-    if m:
-        return m.group("name")
+    values = [v for k, v in params if k == "filename"]
+    if not values:
+        return None
 
-    return None
+    # `filename*` values are decoded to (charset, language, value) tuples.
+    value = next((v for v in values if isinstance(v, tuple)), values[0])
+    return collapse_rfc2231_value(value) or None
 
 
 def safe_filename(name: str) -> str:
@@ -187,7 +244,7 @@ def ensure_vsix_suffix(path: Path) -> Path:
     return path.with_suffix(".vsix")
 
 
-def resolve_vsix_filename(spec: VsixSpec, headers: Mapping[str, str]) -> str:
+def resolve_vsix_filename(spec: VsixSpec, headers: HeaderMap) -> str:
     """
     Decide the final VSIX filename.
 
@@ -195,6 +252,10 @@ def resolve_vsix_filename(spec: VsixSpec, headers: Mapping[str, str]) -> str:
       1) Server-provided Content-Disposition filename (sanitized)
       2) Deterministic fallback derived from spec
 
+    Args:
+        spec: Extension specification.
+        headers: Response headers.
+
     Returns:
         A filename that ends with `.vsix`.
     """
@@ -208,61 +269,300 @@ def resolve_vsix_filename(spec: VsixSpec, headers: Mapping[str, str]) -> str:
 # Streaming / atomic I/O utilities
 # =============================================================================
 
-def iter_response_chunks(resp, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+CHUNK_SIZE = 256 * 1024
+
+
+def iter_response_chunks(resp, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
     """
     Iterate a response body in chunks.
 
+    Reads go into one reusable buffer via `.readinto()` when the response supports it.
+
     Args:
-        resp: A file-like HTTP response object with .read().
+        resp: A file-like HTTP response object with .read() (and ideally .readinto()).
         chunk_size: Chunk size in bytes.
 
     Yields:
         Byte chunks until EOF.
     """
-    while True:
-        chunk = resp.read(chunk_size)
-        if not chunk:
-            break
-        yield chunk
-
-
-def iter_file_chunks(path: Path, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
-    """Iterate a file on disk in fixed-size chunks."""
-    with open(path, "rb") as f:
+    if not hasattr(resp, "readinto"):
         while True:
-            chunk = f.read(chunk_size)
+            chunk = resp.read(chunk_size)
             if not chunk:
                 break
             yield chunk
+        return
+
+    mv = memoryview(bytearray(chunk_size))
+    while n := resp.readinto(mv):
+        yield mv[:n].tobytes()
 
 
-def atomic_write_bytes(dest: Path, data_iter: Iterable[bytes]) -> int:
+def iter_file_chunks(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Iterate a file on disk in fixed-size chunks."""
+    with open(path, "rb") as f:
+        yield from iter_response_chunks(f, chunk_size)
+
+
+class _PrefixedStream:
+    """
+    Read-only stream that replays `prefix` before the rest of `raw`.
+
+    Lets the first bytes of a response be inspected without requiring the
+    response to support `.peek()`; `raw` only needs `.read()`.
+    """
+
+    def __init__(self, prefix: bytes, raw) -> None:
+        self._prefix = prefix
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._prefix:
+            return self._raw.read(size) if size >= 0 else self._raw.read()
+        if size < 0:
+            rest = self._raw.read()
+            data, self._prefix = self._prefix + rest, b""
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        return data
+
+    def readinto(self, b) -> int:
+        if not self._prefix and hasattr(self._raw, "readinto"):
+            return self._raw.readinto(b)
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+def _peek_stream(resp, n: int) -> Tuple[bytes, object]:
+    """
+    Return the first `n` bytes of `resp` and a stream that still yields them.
+
+    Uses `resp.peek()` when available; otherwise reads the bytes and chains
+    them back in front of the rest with `_PrefixedStream`.
+    """
+    if hasattr(resp, "peek"):
+        return resp.peek(n)[:n], resp
+    head = b""
+    while len(head) < n:
+        chunk = resp.read(n - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head, _PrefixedStream(head, resp)
+
+
+class _ThreadedWriter:
+    """
+    Write-behind wrapper: `write()` queues chunks that a worker thread writes to `dst`.
+
+    Lets a CPU-bound producer (zlib inflate) overlap with disk writes; both
+    release the GIL. Writes are queued in slices of at most `CHUNK_SIZE` bytes
+    and the queue holds `maxsize` slices, so at most about
+    `(maxsize + 1) * CHUNK_SIZE` bytes are buffered whatever the producer passes
+    in. Use as a context manager; errors from the writer thread are re-raised in
+    the producer on the next `write()` or on exit.
+    """
+
+    def __init__(self, dst: BinaryIO, maxsize: int = 4) -> None:
+        self._dst = dst
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=maxsize)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._drain, name="vsix-writer", daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        while (chunk := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self._dst.write(chunk)
+                except BaseException as e:  # keep draining so the producer never blocks
+                    self._error = e
+
+    def write(self, data: bytes | memoryview) -> int:
+        if self._error is not None:
+            raise self._error
+        view = memoryview(data)
+        # Copy (views of reused buffers are written later) in bounded slices.
+        for start in range(0, len(view), CHUNK_SIZE):
+            self._queue.put(bytes(view[start : start + CHUNK_SIZE]))
+        return len(view)
+
+    def __enter__(self) -> _ThreadedWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry to disk (best-effort; not supported on Windows)."""
+    try:
+        dfd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dfd)
+
+
+def atomic_write_bytes(
+    dest: Path,
+    data: Iterable[bytes] | BinaryIO,
+    *,
+    durable: bool = True,
+    append: bool = False,
+    expected_size: int | None = None,
+    on_progress: Callable[[int], None] | None = None,
+    write_behind: bool = False,
+) -> int:
     """
     Atomically write streamed bytes to disk using a temporary '.part' file.
 
+    With `durable=True` the sequence is write -> fsync(file) -> rename -> fsync(dir),
+    so after a crash `dest` is either absent or complete.
+
     Args:
         dest: Final destination path.
-        data_iter: Iterable yielding byte chunks.
+        data: Iterable yielding byte chunks, or a binary file-like object.
+            File-likes with `.readinto()` are copied through a single reusable
+            buffer with no per-chunk allocation.
+        durable: If False, skip the fsync calls (for throwaway temporary files).
+        append: If True, extend an existing '.part' file instead of truncating it
+            (used to resume interrupted downloads).
+        expected_size: If given, the final size the file must have; otherwise
+            ConnectionError is raised and the '.part' file is left in place.
+        on_progress: Optional callback invoked after each chunk with the number
+            of bytes written so far by this call.
+        write_behind: If True, disk writes happen on a worker thread (see
+            `_ThreadedWriter`) so a CPU-bound producer such as a decompressor
+            overlaps with I/O.
 
     Returns:
-        Total number of bytes written.
+        Total number of bytes written by this call.
+
+    Raises:
+        ConnectionError: If `expected_size` is given and not met (truncated stream).
     """
     tmp = dest.with_suffix(dest.suffix + ".part")
     total = 0
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(tmp, "wb") as f:
-        for chunk in data_iter:
-            f.write(chunk)
-            total += len(chunk)
+    with open(tmp, "ab" if append else "wb") as f:
+        with _ThreadedWriter(f) if write_behind else nullcontext(f) as out:
+            if hasattr(data, "readinto"):
+                mv = memoryview(bytearray(CHUNK_SIZE))
+                while n := data.readinto(mv):
+                    total += out.write(mv[:n])
+                    if on_progress is not None:
+                        on_progress(total)
+            else:
+                if hasattr(data, "read"):
+                    data = iter_response_chunks(data)
+                for chunk in data:
+                    total += out.write(chunk)
+                    if on_progress is not None:
+                        on_progress(total)
+
+        if expected_size is not None and f.tell() != expected_size:
+            raise ConnectionError(
+                f"Stream ended early: got {f.tell()} of {expected_size} bytes for {dest.name}"
+            )
+
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
 
     tmp.replace(dest)
+    if durable:
+        _fsync_dir(dest.parent)
     return total
 
 
-def _read_prefix(path: Path, n: int = 16) -> bytes:
+def _fast_copy(src: Path, dst: Path) -> int:
+    """
+    Copy a file's bytes, using `os.sendfile` (in-kernel, zero-copy) where available.
+
+    Falls back to `shutil.copyfileobj` on platforms or file systems where
+    sendfile is unsupported.
+
+    Returns:
+        Total number of bytes copied.
+    """
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        size = os.fstat(fin.fileno()).st_size
+        offset = 0
+        if hasattr(os, "sendfile"):
+            try:
+                while offset < size:
+                    sent = os.sendfile(fout.fileno(), fin.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return offset
+            except OSError:
+                if offset:
+                    raise
+                # sendfile not supported here; fall through to the userspace copy.
+        shutil.copyfileobj(fin, fout, CHUNK_SIZE)
+        return fout.tell()
+
+
+@contextmanager
+def _mmap_file(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Map a file read-only for zero-copy inspection.
+
+    Yields an `mmap` (or `b""` for an empty file, which cannot be mapped).
+    Slicing the result touches only the pages actually read.
+    """
     with open(path, "rb") as f:
-        return f.read(n)
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
+
+
+def _mmap_slice(path: Path, start: int = 0, length: int = 64) -> bytes:
+    """Return `length` bytes of the file at `path` starting at `start`."""
+    with _mmap_file(path) as m:
+        return bytes(m[start:start + length])
+
+
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_SIZE = 22
+_EOCD_MAX_SCAN = _EOCD_SIZE + 0xFFFF  # record + maximum comment length
+
+
+def _has_eocd(buf: mmap.mmap | bytes) -> bool:
+    """
+    Check a mapped file for a ZIP End-Of-Central-Directory record.
+
+    The common case (no archive comment) is a single 4-byte compare at
+    `size - 22`; only if that misses is the trailing 64 KB comment window scanned.
+    """
+    size = len(buf)
+    if size < _EOCD_SIZE:
+        return False
+    if buf[size - _EOCD_SIZE:size - _EOCD_SIZE + 4] == _EOCD_SIGNATURE:
+        return True
+    return buf.rfind(_EOCD_SIGNATURE, max(0, size - _EOCD_MAX_SCAN)) != -1
+
+
+def _fast_is_zip(path: Path) -> bool:
+    """Check for a ZIP End-Of-Central-Directory record without parsing the archive."""
+    try:
+        with _mmap_file(path) as m:
+            return _has_eocd(m)
+    except (OSError, ValueError):
+        return False
 
 
 def is_zip_file(path: Path) -> bool:
@@ -275,7 +575,265 @@ def is_zip_file(path: Path) -> bool:
     Returns:
         True if ZIP, False otherwise.
     """
-    return zipfile.is_zipfile(path)
+    return _fast_is_zip(path)
+
+
+# =============================================================================
+# HTTP connection pooling
+# =============================================================================
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+class _PooledResponse:
+    """
+    File-like wrapper around `http.client.HTTPResponse` that hands its
+    connection back to the pool on close (if it is still reusable).
+    """
+
+    def __init__(self, pool: PooledOpener, key: tuple[str, str], conn, resp, url: str) -> None:
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+        self.url = url
+        self.status = resp.status
+        self.headers = resp.headers
+
+    def __getattr__(self, name: str):
+        return getattr(self._resp, name)
+
+    def __enter__(self) -> _PooledResponse:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        # A connection can only be reused once its response has been fully consumed.
+        reusable = self._resp.isclosed() and not self._resp.will_close
+        self._resp.close()
+        if reusable:
+            self._pool._release(self._key, conn)
+        else:
+            conn.close()
+
+
+class PooledOpener:
+    """
+    Minimal keep-alive opener built on `http.client`.
+
+    Idle connections are kept per (scheme, host:port) and reused by subsequent
+    requests, so a batch of downloads from the same host pays the TCP/TLS
+    handshake once per connection instead of once per extension. Instances are
+    thread-safe and can be shared by `download_many` worker threads.
+
+    Only what `download_vsix` needs is implemented: GET/HEAD requests,
+    redirect following, and `HTTPError` for 4xx/5xx responses (mirroring
+    `urlopen`). When proxies are configured in the environment, requests are
+    delegated to `urlopen` so proxy handling keeps working.
+    """
+
+    def __init__(self, maxsize: int = 8, timeout: float | None = None) -> None:
+        self._maxsize = maxsize
+        self._timeout = timeout
+        self._use_urlopen = bool(getproxies())
+        self._idle: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> PooledOpener:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _acquire(self, key: tuple[str, str]):
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                return conns.pop(), True
+        scheme, netloc = key
+        kwargs = {} if self._timeout is None else {"timeout": self._timeout}
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, **kwargs), False
+        return http.client.HTTPConnection(netloc, **kwargs), False
+
+    def _release(self, key: tuple[str, str], conn) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self._maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method: str, url: str, headers: Mapping[str, str], data):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise URLError(f"unsupported URL scheme: {parts.scheme!r}")
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request(method, target, body=data, headers=dict(headers))
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError) as e:
+                conn.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one.
+                    continue
+                raise URLError(e) from e
+            except OSError as e:
+                conn.close()
+                raise URLError(e) from e
+            return _PooledResponse(self, key, conn, resp, url)
+
+    def __call__(self, req: Request):
+        if self._use_urlopen:
+            if self._timeout is None:
+                return urlopen(req)
+            return urlopen(req, timeout=self._timeout)
+
+        method = req.get_method()
+        url = req.full_url
+        headers = dict(req.header_items())
+        headers.setdefault("Connection", "keep-alive")
+        data = req.data
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            resp = self._send(method, url, headers, data)
+            if resp.status in _REDIRECT_CODES and resp.headers.get("Location"):
+                location = urljoin(url, resp.headers["Location"])
+                resp.read()
+                resp.close()
+                if resp.status == 303:
+                    method, data = "GET", None
+                url = location
+                continue
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, resp)
+            return resp
+
+        raise HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+
+def make_pooled_opener(maxsize: int = 8, timeout: float | None = None) -> PooledOpener:
+    """
+    Build an opener that reuses keep-alive connections across requests.
+
+    Args:
+        maxsize: Maximum number of idle connections kept per host.
+        timeout: Optional socket timeout in seconds.
+
+    Returns:
+        A `PooledOpener` usable as `opener=`. Close it (or use it as a context
+        manager) once done to release idle connections.
+    """
+    return PooledOpener(maxsize=maxsize, timeout=timeout)
+
+
+class _HttpxResponse(io.RawIOBase):
+    """
+    Raw file-like over an `httpx` streaming response.
+
+    Bytes are read with `iter_raw()` so Content-Encoding is left untouched,
+    exactly like urllib; gzip decoding stays in `download_vspackage_payload`.
+    """
+
+    def __init__(self, stream_cm) -> None:
+        super().__init__()
+        self._cm = stream_cm
+        try:
+            self._resp = stream_cm.__enter__()
+        except httpx.HTTPError as e:
+            raise URLError(e) from e
+        self._chunks = self._resp.iter_raw(CHUNK_SIZE)
+        self._pending = b""
+        self.url = str(self._resp.url)
+        self.status = self._resp.status_code
+        self.reason = self._resp.reason_phrase
+        self.headers = self._resp.headers
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self._pending:
+            try:
+                self._pending = next(self._chunks, b"")
+            except httpx.HTTPError as e:
+                raise URLError(e) from e
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._cm.__exit__(None, None, None)
+        super().close()
+
+
+class _HttpxOpener:
+    """Opener backed by a shared `httpx.Client` (HTTP/2 when the server supports it)."""
+
+    def __init__(self, client) -> None:
+        self._client = client
+
+    def __call__(self, req: Request) -> _HttpxResponse:
+        resp = _HttpxResponse(
+            self._client.stream(
+                req.get_method(),
+                req.full_url,
+                headers=dict(req.header_items()),
+                content=req.data,
+            )
+        )
+        if resp.status >= 400:
+            resp.close()
+            raise HTTPError(resp.url, resp.status, resp.reason, resp.headers, None)  # type: ignore[arg-type]
+        return resp
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def _make_batch_opener(maxsize: int):
+    """
+    Build the shared opener used by `download_many` when none is given.
+
+    Prefers an HTTP/2 `httpx` client, so concurrent downloads to the same host
+    are multiplexed over one TLS connection. Falls back to `PooledOpener` when `httpx` (or its
+    `h2` extra) is not installed.
+    """
+    if httpx is not None:
+        try:
+            client = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                timeout=None,
+                limits=httpx.Limits(max_connections=maxsize, max_keepalive_connections=maxsize),
+            )
+        except ImportError:
+            pass  # httpx installed without the `http2` extra
+        else:
+            return _HttpxOpener(client)
+    return make_pooled_opener(maxsize=maxsize)
 
 
 # =============================================================================
@@ -290,14 +848,25 @@ def download_vspackage_payload(
     user_agent: str,
     opener: Callable[[Request], object],
     log: logging.Logger,
-) -> Tuple[Path, Path, Mapping[str, str]]:
+    on_progress: Callable[[int], None] | None = None,
+    durable: bool = True,
+    claim_path: Callable[[VsixSpec, Path], Path] | None = None,
+) -> Tuple[Path, Path, HeaderMap, bytes]:
     """
     Download the Marketplace payload into a `.download` file.
 
-    Important detail:
+    Important details:
       The output filename is resolved from response headers *before* streaming the body,
       so we never end up "switching" paths after the download.
 
+      gzip-encoded bodies (Content-Encoding or magic bytes) are decompressed while
+      streaming, so the `.download` file then already holds the decoded bytes.
+
+      Interrupted downloads of non-gzip payloads are resumed: the partial
+      `.download.part` file is kept along with a `.resume.json` sidecar holding the
+      server validator (ETag / Last-Modified), and the next attempt sends
+      `Range` + `If-Range`. A 206 reply is appended; anything else restarts.
+
     Args:
         url: Download URL (vspackage endpoint).
         spec: The extension spec.
@@ -305,9 +874,18 @@ def download_vspackage_payload(
         user_agent: User-Agent header value.
         opener: Injectable opener for testability.
         log: Logger instance.
+        on_progress: Optional callback receiving the number of payload bytes
+            written so far (see `atomic_write_bytes`). On resume the count
+            includes the bytes already on disk.
+        durable: If False, skip the fsync calls when writing the `.download`
+            file (for callers that only use it as input to another step).
+        claim_path: Optional hook called with the resolved final path; returns the
+            path to actually use (see `_OutputNames`).
 
     Returns:
-        (final_vsix_path, raw_download_path, headers)
+        (final_vsix_path, raw_download_path, headers, magic), where `headers`
+        is the response's own (case-insensitive) header object and `magic` is
+        the first 4 bytes of the body as received (before any gzip decoding).
 
     Raises:
         URLError / HTTPError: from urllib on network/HTTP failures.
@@ -315,34 +893,237 @@ def download_vspackage_payload(
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
 
-    req = Request(
-        url,
-        headers={
+    meta_path = dest_dir / (default_vsix_name(spec) + ".resume.json")
+    resume = _load_resume_state(meta_path, url)
+    have = 0
+    if resume is not None:
+        partial_path = dest_dir / resume["part"]
+        have = partial_path.stat().st_size if partial_path.exists() else 0
+
+    # At most two passes: a resume attempt, then (if the server can't continue) a fresh download.
+    while True:
+        headers = {
             "User-Agent": user_agent,
-            # Request identity encoding to avoid gzip surprises where possible.
-            # We still handle gzip defensively in normalize_to_zip().
-            "Accept-Encoding": "identity",
-        },
-    )
+            # gzip bodies are decoded while streaming, so let the server compress.
+            "Accept-Encoding": "gzip",
+        }
+        if have:
+            headers["Range"] = f"bytes={have}-"
+            headers["If-Range"] = resume["validator"]  # type: ignore[index]
+            # Ranges apply to the encoded body; only resume identity-encoded payloads.
+            headers["Accept-Encoding"] = "identity"
+            log.info("HTTP GET: %s (resuming from byte %d)", url, have)
+        else:
+            log.info("HTTP GET: %s", url)
+
+        try:
+            resp_cm = opener(Request(url, headers=headers))
+        except HTTPError as e:
+            if not (have and e.code == 416):
+                raise
+            log.info("Server rejected the resume range; restarting download")
+            (dest_dir / resume["part"]).unlink(missing_ok=True)  # type: ignore[index]
+            have = 0
+            continue
+
+        with resp_cm as resp:  # type: ignore[attr-defined]
+            # Keep the response's own header object: it is case-insensitive and
+            # remains usable after the response is closed.
+            hdrs = resp.headers
+
+            final_name = resolve_vsix_filename(spec, hdrs)
+            final_vsix = ensure_vsix_suffix(dest_dir / final_name)
+            if claim_path is not None:
+                final_vsix = claim_path(spec, final_vsix)
+            raw_download = final_vsix.with_suffix(final_vsix.suffix + ".download")
+            part = raw_download.with_suffix(raw_download.suffix + ".part")
+
+            status = getattr(resp, "status", 200)
+            resuming = (
+                have > 0
+                and status == 206
+                and resume["part"] == part.name  # type: ignore[index]
+                and _content_range_start(hdrs) == have
+                and not _header_get(hdrs, "Content-Encoding")
+            )
+            if have and status == 206 and not resuming:
+                log.info("Partial response does not match the saved download; restarting")
+                (dest_dir / resume["part"]).unlink(missing_ok=True)  # type: ignore[index]
+                have = 0
+                continue
+
+            stream = resp
+            write_behind = False
+            expected = _content_length(hdrs)
+            if resuming:
+                log.info("Resuming payload: %s", part)
+                magic = _mmap_slice(part, 0, 4)
+            else:
+                # Look at the magic bytes without losing them from the stream.
+                magic, stream = _peek_stream(resp, 4)
+                if _is_gzip_payload(hdrs, magic):
+                    # Decoded bytes cannot be resumed with a Range on the encoded body.
+                    log.info("Detected gzip-encoded payload; decompressing while streaming")
+                    stream = _gunzip_chunks(stream)
+                    write_behind = True
+                    meta_path.unlink(missing_ok=True)
+                    expected = None  # Content-Length counts encoded bytes
+                else:
+                    _save_resume_state(meta_path, url, hdrs, part)
+
+            log.info("Saving payload to: %s", raw_download)
+            progress = on_progress
+            if resuming:
+                if expected is not None:
+                    expected += have
+                if on_progress is not None:
+                    # Report the payload total, not just the bytes fetched by this request.
+                    progress = partial(_offset_progress, on_progress, have)
+            total = atomic_write_bytes(
+                raw_download,
+                stream,
+                durable=durable,
+                append=resuming,
+                expected_size=expected,
+                on_progress=progress,
+                write_behind=write_behind,
+            )
+            log.info("Downloaded %d bytes -> %s", total, raw_download)
 
-    log.info("HTTP GET: %s", url)
+        meta_path.unlink(missing_ok=True)
+        return final_vsix, raw_download, hdrs, magic
 
-    with opener(req) as resp:  # type: ignore[call-arg]
-        # urllib headers are typically an email.message.Message which supports .items()
-        hdrs: Mapping[str, str] = dict(getattr(resp, "headers", {}).items())
 
-        final_name = resolve_vsix_filename(spec, hdrs)
-        final_vsix = ensure_vsix_suffix(dest_dir / final_name)
-        raw_download = final_vsix.with_suffix(final_vsix.suffix + ".download")
+def _offset_progress(on_progress: Callable[[int], None], offset: int, n: int) -> None:
+    """Forward a progress count shifted by `offset` (bytes already on disk)."""
+    on_progress(offset + n)
 
-        log.info("Saving payload to: %s", raw_download)
-        total = atomic_write_bytes(raw_download, iter_response_chunks(resp))
-        log.info("Downloaded %d bytes -> %s", total, raw_download)
 
-    return final_vsix, raw_download, hdrs
+def _load_resume_state(meta_path: Path, url: str) -> dict | None:
+    """Load the resume sidecar written by `_save_resume_state`, if it matches `url`."""
+    try:
+        state = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("url") != url:
+        return None
+    if not state.get("validator") or not state.get("part"):
+        return None
+    return state
 
 
-def normalize_to_zip(src: Path, dest: Path, headers: Mapping[str, str], *, log: logging.Logger) -> None:
+def _save_resume_state(meta_path: Path, url: str, headers: HeaderMap, part: Path) -> None:
+    """
+    Record what is needed to resume `part` later.
+
+    Only strong validators make a safe `If-Range`; without an ETag or
+    Last-Modified header the sidecar is removed and a retry starts over.
+    """
+    etag = _header_get(headers, "ETag")
+    validator = etag if etag and not etag.startswith("W/") else _header_get(headers, "Last-Modified")
+    if not validator:
+        meta_path.unlink(missing_ok=True)
+        return
+    state = {"url": url, "validator": validator, "part": part.name}
+    meta_path.write_text(json.dumps(state), encoding="utf-8")
+
+
+def _content_length(headers: HeaderMap) -> int | None:
+    """Return the Content-Length header as an int, if present and valid."""
+    value = (_header_get(headers, "Content-Length") or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def _content_range_start(headers: HeaderMap) -> int | None:
+    """Return the first byte offset from a `Content-Range: bytes a-b/n` header."""
+    value = _header_get(headers, "Content-Range") or ""
+    unit, _, rng = value.strip().partition(" ")
+    if unit.lower() != "bytes":
+        return None
+    start, _, _ = rng.partition("-")
+    return int(start) if start.isdigit() else None
+
+
+def _is_gzip_payload(headers: HeaderMap, magic: bytes) -> bool:
+    """Return True if the payload is gzip-encoded (by Content-Encoding or magic bytes)."""
+    content_encoding = (_header_get(headers, "Content-Encoding") or "").lower().strip()
+    return magic[:2] == b"\x1f\x8b" or "gzip" in content_encoding
+
+
+def _require_zip(path: Path) -> None:
+    """Raise ValueError with a diagnostic preview if `path` is not a ZIP file."""
+    # One mapping serves both the signature check and the error preview.
+    with _mmap_file(path) as m:
+        if _has_eocd(m):
+            return
+        head = bytes(m[:64])
+    raise ValueError(
+        "Downloaded payload is not a ZIP/VSIX file after normalization. "
+        "This usually means the request returned an HTML error page "
+        "(wrong version / wrong targetPlatform / endpoint changed). "
+        f"First bytes: {head!r}"
+    )
+
+
+def _gunzip_chunks(src) -> Iterator[bytes]:
+    """
+    Decompress a gzip stream from `src` with `zlib.decompressobj`, chunk by chunk.
+
+    The whole inflate runs in C (no per-block Python header parsing as in
+    `GzipFile`); input is read through one reusable buffer when `src` supports
+    `.readinto()`, otherwise with `.read()`. Concatenated gzip members are
+    handled like `gzip.open` does.
+
+    Yields:
+        Decompressed byte chunks of at most `CHUNK_SIZE` bytes.
+
+    Raises:
+        gzip.BadGzipFile: If the data is not valid gzip.
+        EOFError: If the stream ends before the end-of-stream marker.
+    """
+    d = None
+    for data in _iter_input(src):
+        while data:
+            if d is None:
+                if data[0] == 0:
+                    # Zero padding after the last member, as tolerated by gzip.open.
+                    data = bytes(data).lstrip(b"\x00")
+                    continue
+                d = zlib.decompressobj(wbits=31)
+            # Cap each output chunk: highly compressible input can otherwise
+            # inflate into a single huge bytes object.
+            while True:
+                try:
+                    out = d.decompress(data, CHUNK_SIZE)
+                except zlib.error as e:
+                    raise gzip.BadGzipFile(f"Invalid gzip data: {e}") from e
+                if out:
+                    yield out
+                data = d.unconsumed_tail
+                if d.eof or (not data and len(out) < CHUNK_SIZE):
+                    break
+            if not d.eof:
+                break
+            data = d.unused_data  # start of the next member, if any
+            d = None
+    if d is not None:
+        if tail := d.flush():
+            yield tail
+        if not d.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+
+def _iter_input(src) -> Iterator[bytes | memoryview]:
+    """Read `src` in chunks, reusing one buffer (yielded views are valid until the next step)."""
+    if not hasattr(src, "readinto"):
+        yield from iter_response_chunks(src)
+        return
+    mv = memoryview(bytearray(CHUNK_SIZE))
+    while n := src.readinto(mv):
+        yield mv[:n]
+
+
+def normalize_to_zip(src: Path, dest: Path, headers: HeaderMap, *, log: logging.Logger) -> None:
     """
     Normalize a downloaded payload into a ZIP file.
 
@@ -366,67 +1147,182 @@ def normalize_to_zip(src: Path, dest: Path, headers: Mapping[str, str], *, log:
     Raises:
         ValueError: If the normalized output is not a ZIP file.
     """
-    content_encoding = (_header_get(headers, "Content-Encoding") or "").lower().strip()
-
-    magic = _read_prefix(src, 2)
-    is_gzip_magic = magic == b"\x1f\x8b"
-    is_gzip_header = "gzip" in content_encoding
-
-    if is_gzip_magic or is_gzip_header:
+    if _is_gzip_payload(headers, _mmap_slice(src, 0, 2)):
         log.info("Normalizing: detected gzip-encoded payload; decompressing")
+        with open(src, "rb") as zin:
+            atomic_write_bytes(dest, _gunzip_chunks(zin), write_behind=True)
+    else:
+        log.info("Normalizing: payload is not gzip-encoded; copying as-is")
         tmp = dest.with_suffix(dest.suffix + ".part")
         dest.parent.mkdir(parents=True, exist_ok=True)
-        with gzip.open(src, "rb") as zin, open(tmp, "wb") as zout:
-            while True:
-                chunk = zin.read(1024 * 1024)
-                if not chunk:
-                    break
-                zout.write(chunk)
+        _fast_copy(src, tmp)
         tmp.replace(dest)
+
+    _require_zip(dest)
+
+
+_ZIP_FLAG_ENCRYPTED = 0x01
+_ZIP_FLAG_DATA_DESCRIPTOR = 0x08
+
+# zipfile's local-header layout and writer internals are not in the type stubs.
+_zipfile: Any = zipfile
+
+
+def _verify_member(zin: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    Read a member through `ZipFile.open` to check its local header and CRC.
+
+    Only decompresses; nothing is re-compressed. Encrypted members are skipped
+    (their CRC cannot be checked without the password).
+
+    Raises:
+        zipfile.BadZipFile: On a bad local header, name mismatch or CRC error.
+    """
+    if info.flag_bits & _ZIP_FLAG_ENCRYPTED:
+        return
+    with zin.open(info) as f:
+        while f.read(CHUNK_SIZE):
+            pass
+
+
+def _skip_local_header(zin: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    Validate `info`'s local file header and leave `zin.fp` at the member data.
+
+    Mirrors the checks `ZipFile.open` makes before reading a member.
+
+    Raises:
+        zipfile.BadZipFile: If the header is truncated, has a bad signature, or
+            names a different file than the central directory.
+    """
+    fp: Any = zin.fp
+    fp.seek(info.header_offset)
+    raw = fp.read(_zipfile.sizeFileHeader)
+    if len(raw) != _zipfile.sizeFileHeader:
+        raise zipfile.BadZipFile(f"Truncated file header: {info.filename}")
+    fh = struct.unpack(_zipfile.structFileHeader, raw)
+    if fh[_zipfile._FH_SIGNATURE] != _zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad magic number for file header: {info.filename}")
+
+    fname = fp.read(fh[_zipfile._FH_FILENAME_LENGTH])
+    if fh[_zipfile._FH_GENERAL_PURPOSE_FLAG_BITS] & _zipfile._MASK_UTF_FILENAME:
+        fname_str = fname.decode("utf-8")
     else:
-        log.info("Normalizing: payload is not gzip-encoded; copying as-is")
-        atomic_write_bytes(dest, iter_file_chunks(src))
-
-    if not is_zip_file(dest):
-        head = _read_prefix(dest, 64)
-        raise ValueError(
-            "Downloaded payload is not a ZIP/VSIX file after normalization. "
-            "This usually means the request returned an HTML error page "
-            "(wrong version / wrong targetPlatform / endpoint changed). "
-            f"First bytes: {head!r}"
+        fname_str = fname.decode(getattr(zin, "metadata_encoding", None) or "cp437")
+    if fname_str != info.orig_filename:
+        raise zipfile.BadZipFile(
+            f"File name in directory {info.orig_filename!r} and header {fname!r} differ."
         )
+    fp.seek(fh[_zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
 
 
-def repack_zip(src_zip: Path, dest_zip: Path, *, log: logging.Logger) -> None:
+def _copy_raw_member(
+    zin: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    zout: zipfile.ZipFile,
+    new_info: zipfile.ZipInfo,
+) -> None:
+    """
+    Append `info`'s compressed bytes from `zin` to `zout` verbatim.
+
+    zipfile has no public API for raw member copies, so this writes the local
+    header itself and registers the entry the same way `ZipFile.open(..., "w")` does.
+    The member is verified first (see `_verify_member` / `_skip_local_header`),
+    so a corrupt source fails here rather than in the copy.
+
+    Raises:
+        zipfile.BadZipFile: If the source member is corrupt or truncated.
+    """
+    _verify_member(zin, info)
+
+    new_info.compress_type = info.compress_type
+    new_info.CRC = info.CRC
+    new_info.compress_size = info.compress_size
+    new_info.file_size = info.file_size
+    # Sizes and CRC are known up front, so they go in the local header. Encrypted
+    # members keep their data descriptor: with bit 3 set, the password check byte
+    # in the encryption header is derived from the mod time rather than the CRC.
+    descriptor = bool(
+        info.flag_bits & _ZIP_FLAG_ENCRYPTED and info.flag_bits & _ZIP_FLAG_DATA_DESCRIPTOR
+    )
+    if not descriptor:
+        new_info.flag_bits &= ~_ZIP_FLAG_DATA_DESCRIPTOR
+
+    _skip_local_header(zin, info)
+    src: Any = zin.fp
+    out: Any = zout
+
+    zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+    with out._lock:
+        if out._seekable:
+            out.fp.seek(out.start_dir)
+        new_info.header_offset = out.fp.tell()
+        out._writecheck(new_info)
+        out._didModify = True
+        out.fp.write(new_info.FileHeader(zip64))
+
+        remaining = info.compress_size
+        while remaining:
+            chunk = src.read(min(remaining, CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member data: {info.filename}")
+            out.fp.write(chunk)
+            remaining -= len(chunk)
+        if descriptor:
+            fmt = "<LLQQ" if zip64 else "<LLLL"
+            out.fp.write(
+                struct.pack(fmt, 0x08074B50, info.CRC, info.compress_size, info.file_size)
+            )
+
+        out.filelist.append(new_info)
+        out.NameToInfo[new_info.filename] = new_info
+        out.start_dir = out.fp.tell()
+
+
+def repack_zip(
+    src_zip: Path,
+    dest_zip: Path,
+    *,
+    log: logging.Logger,
+    already_validated: bool = False,
+) -> None:
     """
     Re-pack an existing ZIP file into a fresh ZIP container.
 
-    This is a pragmatic “make it definitely a normal ZIP” step. It can help when:
-      - you want consistent compression,
-      - you want to ensure the output is a conventional ZIP container.
+    This is a pragmatic “make it definitely a normal ZIP” step. It can help when
+    you want to ensure the output is a conventional ZIP container.
+
+    Member data is copied as raw compressed bytes (no re-deflate); only the local
+    headers and central directory are rewritten. Each member is still checked
+    first: its local header is validated and its data is inflated once to verify
+    the CRC, as `ZipFile.open` would. Encrypted members are copied the same way,
+    ciphertext included, so no password is needed; their CRC is not verified.
+    `compresslevel=1` only applies to the (empty) directory entries zipfile
+    writes itself.
 
     Args:
         src_zip: Source ZIP file.
         dest_zip: Destination ZIP file (often `*.vsix`).
         log: Logger.
+        already_validated: Skip the ZIP signature check when the caller has just
+            validated `src_zip` (e.g. via `normalize_to_zip`).
 
     Raises:
         ValueError: If src_zip is not a ZIP file.
+        zipfile.BadZipFile: If a member is corrupt (bad local header or CRC).
     """
-    if not is_zip_file(src_zip):
-        head = _read_prefix(src_zip, 64)
+    if not already_validated and not is_zip_file(src_zip):
+        head = _mmap_slice(src_zip, 0, 64)
         raise ValueError(f"Cannot repack: source is not a ZIP file. First bytes: {head!r}")
 
     tmp = dest_zip.with_suffix(dest_zip.suffix + ".part")
     dest_zip.parent.mkdir(parents=True, exist_ok=True)
 
     log.info("Repacking ZIP -> VSIX container")
-    with zipfile.ZipFile(src_zip, "r") as zin, zipfile.ZipFile(
-        tmp, "w", compression=zipfile.ZIP_DEFLATED
+    with open(tmp, "wb") as f, zipfile.ZipFile(src_zip, "r") as zin, zipfile.ZipFile(
+        f, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
     ) as zout:
         for info in zin.infolist():
-            data = b"" if info.is_dir() else zin.read(info.filename)
-
             # Preserve essential metadata where practical.
             new_info = zipfile.ZipInfo(filename=info.filename, date_time=info.date_time)
             new_info.external_attr = info.external_attr
@@ -438,10 +1334,21 @@ def repack_zip(src_zip: Path, dest_zip: Path, *, log: logging.Logger) -> None:
             new_info.volume = info.volume
             new_info.comment = info.comment
             new_info.extra = info.extra
+            new_info.compress_type = info.compress_type
+
+            if info.is_dir():
+                zout.writestr(new_info, b"")
+                continue
 
-            zout.writestr(new_info, data)
+            _copy_raw_member(zin, info, zout, new_info)
+
+        # Flush only once the central directory has been written (zout closed).
+        zout.close()
+        f.flush()
+        os.fsync(f.fileno())
 
     tmp.replace(dest_zip)
+    _fsync_dir(dest_zip.parent)
 
 
 # =============================================================================
@@ -452,28 +1359,39 @@ def download_vsix(
     spec: VsixSpec,
     dest_dir: Path | None = None,
     *,
-    repack: bool = True,
+    repack: bool = False,
     user_agent: str = "vsix-downloader/1.0 (+python urllib)",
     opener: Callable[[Request], object] = urlopen,
     log: Optional[logging.Logger] = None,
+    on_progress: Callable[[int], None] | None = None,
+    claim_path: Callable[[VsixSpec, Path], Path] | None = None,
 ) -> Path:
     """
     Download an extension package and produce an installable `.vsix`.
 
     Pipeline:
       1) Open URL and resolve the output filename from headers (before streaming)
-      2) Download raw payload to `<name>.vsix.download`
-      3) Normalize payload into ZIP bytes
-      4) Optionally re-pack into a clean ZIP container
-      5) Write final `*.vsix` and clean up temporary files
+      2) Download payload to `<name>.vsix.download` (gzip is decoded while streaming)
+      3) Validate the payload as a ZIP container
+      4) Produce the final `*.vsix`:
+           - repack=False: rename the download into place (no extra copy)
+           - repack=True:  re-pack the download into a clean ZIP container
+
+    The payload is written to disk once (twice with `repack=True`), whether or
+    not it arrived gzip-encoded. It is staged under `.download` so an invalid
+    payload never appears under the final name.
 
     Args:
         spec: Extension spec to download.
         dest_dir: Destination directory (defaults to current working directory).
-        repack: If True (default), re-pack the normalized ZIP into a fresh container.
+        repack: If True, re-pack the normalized ZIP into a fresh container (off by default).
         user_agent: User-Agent header to send.
         opener: Injectable opener for testability (defaults to urllib.request.urlopen).
         log: Optional logger (defaults to this module's logger).
+        on_progress: Optional callback receiving the number of payload bytes
+            downloaded so far. Called once per chunk; None (default) costs nothing.
+        claim_path: Optional hook that may redirect the resolved output path
+            (used by `download_many` to keep concurrent outputs apart).
 
     Returns:
         Path to the resulting `.vsix` file.
@@ -490,80 +1408,163 @@ def download_vsix(
     url = build_vspackage_url(spec)
     log.info("Preparing: %s@%s", spec.unique_identifier, spec.version)
 
-    final_vsix, raw_download, headers = download_vspackage_payload(
+    final_vsix, raw_download, headers, magic = download_vspackage_payload(
         url,
         spec=spec,
         dest_dir=dest_dir,
         user_agent=user_agent,
         opener=opener,
         log=log,
+        on_progress=on_progress,
+        # With repack, the `.download` is only repack_zip's input; the VSIX it writes is fsynced.
+        durable=not repack,
+        claim_path=claim_path,
     )
 
-    normalized_zip = final_vsix.with_suffix(final_vsix.suffix + ".normalized.zip")
-
-    log.info("Validating/normalizing payload into a ZIP container")
-    normalize_to_zip(raw_download, normalized_zip, headers, log=log)
+    # gzip payloads were decoded while streaming, so in every case the download
+    # already holds the ZIP bytes; no separate normalization copy is needed.
+    is_gzip = _is_gzip_payload(headers, magic)
+    log.info("Validating %spayload as a ZIP container", "decoded " if is_gzip else "")
+    _require_zip(raw_download)
 
     log.info("Producing final VSIX: %s", final_vsix)
     if repack:
-        repack_zip(normalized_zip, final_vsix, log=log)
-    else:
-        tmp = final_vsix.with_suffix(final_vsix.suffix + ".part")
-        atomic_write_bytes(tmp, iter_file_chunks(normalized_zip))
-        tmp.replace(final_vsix)
-
-    # Cleanup (best-effort)
-    for p in (raw_download, normalized_zip):
+        repack_zip(raw_download, final_vsix, log=log, already_validated=True)
+        # Cleanup (best-effort)
         try:
-            p.unlink(missing_ok=True)
+            raw_download.unlink(missing_ok=True)
         except OSError:
-            log.warning("Could not remove temporary file: %s", p)
+            log.warning("Could not remove temporary file: %s", raw_download)
+    else:
+        raw_download.replace(final_vsix)
+        _fsync_dir(final_vsix.parent)
 
     log.info("Done: %s", final_vsix)
     return final_vsix
 
 
+class _OutputNames:
+    """
+    Output paths claimed so far by one `download_many` batch.
+
+    Two specs (e.g. one extension for two target platforms) may get the same
+    Content-Disposition name. The first to claim a path keeps it; later specs
+    fall back to `default_vsix_name(spec)`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._owners: dict[Path, VsixSpec] = {}
+
+    def claim(self, spec: VsixSpec, path: Path) -> Path:
+        """
+        Reserve `path` for `spec`, or its default name if another spec holds it.
+
+        Raises:
+            ValueError: If the fallback name is taken as well.
+        """
+        with self._lock:
+            for candidate in (path, path.with_name(default_vsix_name(spec))):
+                owner = self._owners.setdefault(candidate, spec)
+                if owner == spec:
+                    return candidate
+            raise ValueError(
+                f"Duplicate output name in batch: {path.name} and its fallback "
+                f"{candidate.name} are both taken (claimed for {spec!r})"
+            )
+
+
 def download_many(
     specs: Iterable[VsixSpec],
     dest_dir: Path | None = None,
     *,
-    repack: bool = True,
+    repack: bool = False,
     user_agent: str = "vsix-downloader/1.0 (+python urllib)",
-    opener: Callable[[Request], object] = urlopen,
+    opener: Callable[[Request], object] | None = None,
     log: Optional[logging.Logger] = None,
+    max_workers: int = 4,
+    on_progress: Callable[[VsixSpec, int], None] | None = None,
 ) -> list[Path]:
     """
     Download multiple extensions and produce installable `.vsix` files.
 
+    Downloads are network-bound, so they are dispatched to a thread pool and
+    allowed to overlap. Duplicate specs are downloaded once. Results are
+    returned in the same order (and with the same length) as `specs`.
+    Unless an opener is given, all downloads share one client that reuses
+    connections across requests: an HTTP/2 `httpx` client if `httpx[http2]`
+    is installed, otherwise a keep-alive pool (see `make_pooled_opener`).
+    Either holds up to `max_workers` connections.
+
     Args:
         specs: Iterable of extension specs.
         dest_dir: Destination directory (defaults to CWD).
-        repack: If True (default), re-pack each normalized ZIP into a fresh container.
+        repack: If True, re-pack each normalized ZIP into a fresh container (off by default).
         user_agent: User-Agent header.
-        opener: Injectable opener for testability.
+        opener: Injectable opener for testability. Defaults to a shared
+            HTTP/2 or keep-alive opener for the whole batch.
         log: Optional logger.
+        max_workers: Maximum number of concurrent downloads.
+        on_progress: Optional callback receiving `(spec, bytes_so_far)` for each
+            download. It is called from worker threads.
 
     Returns:
         List of paths to downloaded `.vsix` files.
+
+    Raises:
+        The exception of the first download to fail, in completion order (not
+        necessarily the first failing spec in `specs`). Downloads that have not
+        started yet are cancelled; those already running finish first.
     """
     log = log or logger
     specs_list = list(specs)
     log.info("Starting batch download (%d extension(s))", len(specs_list))
 
-    results: list[Path] = []
-    for i, spec in enumerate(specs_list, start=1):
-        log.info("(%d/%d) %s", i, len(specs_list), spec.unique_identifier)
-        results.append(
-            download_vsix(
-                spec,
-                dest_dir=dest_dir,
-                repack=repack,
-                user_agent=user_agent,
-                opener=opener,
-                log=log,
-            )
-        )
-
+    if not specs_list:
+        log.info("Batch download complete (0 file(s))")
+        return []
+
+    # Identical specs would race on the same `.download.part` file; download each once.
+    unique_specs = list(dict.fromkeys(specs_list))
+    paths: dict[VsixSpec, Path] = {}
+    # Different specs can still resolve to the same server-provided filename.
+    names = _OutputNames()
+    workers = max(1, min(max_workers, len(unique_specs)))
+
+    pooled = _make_batch_opener(workers) if opener is None else None
+    opener = opener or pooled
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {}
+            for spec in unique_specs:
+                fut = ex.submit(
+                    download_vsix,
+                    spec,
+                    dest_dir=dest_dir,
+                    repack=repack,
+                    user_agent=user_agent,
+                    opener=opener,
+                    log=log,
+                    on_progress=None if on_progress is None else partial(on_progress, spec),
+                    claim_path=names.claim,
+                )
+                futures[fut] = spec
+
+            for done, fut in enumerate(as_completed(futures), 1):
+                spec = futures[fut]
+                try:
+                    paths[spec] = fut.result()
+                except BaseException:
+                    # Don't start downloads whose results would be thrown away.
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    raise
+                log.info("(%d/%d) %s", done, len(unique_specs), spec.unique_identifier)
+    finally:
+        if pooled is not None:
+            pooled.close()
+
+    results = [paths[spec] for spec in specs_list]
     log.info("Batch download complete (%d file(s))", len(results))
     return results
 